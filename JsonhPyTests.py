@@ -1,6 +1,6 @@
 import math
 import unittest
-from typing import cast
+from typing import Iterator, cast
 from src.JsonhPy.JsonhPy import JsonhReader, JsonhReaderOptions, JsonhVersion, JsonhResult, JsonhToken, JsonTokenType, JsonhNumberParser
 
 class JsonhPyTests(unittest.TestCase):
@@ -15,16 +15,22 @@ class JsonhPyTests(unittest.TestCase):
 }
 """
         reader: JsonhReader = JsonhReader(jsonh)
-        tokens: list[JsonhResult[JsonhToken, str]] = list(reader.read_element())
-
-        for token in tokens:
-            self.assertFalse(token.is_error)
-        self.assertEqual(tokens[0].value().json_type, JsonTokenType.START_OBJECT)
-        self.assertEqual(tokens[1].value().json_type, JsonTokenType.PROPERTY_NAME)
-        self.assertEqual(tokens[1].value().value, "a")
-        self.assertEqual(tokens[2].value().json_type, JsonTokenType.STRING)
-        self.assertEqual(tokens[2].value().value, "b")
-        self.assertEqual(tokens[3].value().json_type, JsonTokenType.END_OBJECT)
+        tokens: Iterator[JsonhResult[JsonhToken, str]] = iter(reader.read_element())
+
+        expected_tokens: list[tuple[JsonTokenType, str]] = [
+            (JsonTokenType.START_OBJECT, ""),
+            (JsonTokenType.PROPERTY_NAME, "a"),
+            (JsonTokenType.STRING, "b"),
+            (JsonTokenType.END_OBJECT, ""),
+        ]
+        for index, (json_type, value) in enumerate(expected_tokens):
+            with self.subTest(index = index):
+                token: JsonhResult[JsonhToken, str] = next(tokens)
+                self.assertFalse(token.is_error)
+                token_value: JsonhToken = token.value()
+                self.assertEqual(token_value.json_type, json_type)
+                self.assertEqual(token_value.value, value)
+        self.assertIsNone(next(tokens, None))
 
     def test_NestableBlockCommentTest(self):
         jsonh: str = """
@@ -35,20 +41,23 @@ class JsonhPyTests(unittest.TestCase):
 0
 """
         reader: JsonhReader = JsonhReader(jsonh)
-        tokens: list[JsonhResult[JsonhToken, str]] = list(reader.read_element())
-
-        for token in tokens:
-            self.assertFalse(token.is_error)
-        self.assertEqual(tokens[0].value().json_type, JsonTokenType.COMMENT)
-        self.assertEqual(tokens[0].value().value, " ")
-        self.assertEqual(tokens[1].value().json_type, JsonTokenType.COMMENT)
-        self.assertEqual(tokens[1].value().value, " ")
-        self.assertEqual(tokens[2].value().json_type, JsonTokenType.COMMENT)
-        self.assertEqual(tokens[2].value().value, "/=**=/")
-        self.assertEqual(tokens[3].value().json_type, JsonTokenType.COMMENT)
-        self.assertEqual(tokens[3].value().value, "/==**==/")
-        self.assertEqual(tokens[4].value().json_type, JsonTokenType.NUMBER)
-        self.assertEqual(tokens[4].value().value, "0")
+        tokens: Iterator[JsonhResult[JsonhToken, str]] = iter(reader.read_element())
+
+        expected_tokens: list[tuple[JsonTokenType, str]] = [
+            (JsonTokenType.COMMENT, " "),
+            (JsonTokenType.COMMENT, " "),
+            (JsonTokenType.COMMENT, "/=**=/"),
+            (JsonTokenType.COMMENT, "/==**==/"),
+            (JsonTokenType.NUMBER, "0"),
+        ]
+        for index, (json_type, value) in enumerate(expected_tokens):
+            with self.subTest(index = index):
+                token: JsonhResult[JsonhToken, str] = next(tokens)
+                self.assertFalse(token.is_error)
+                token_value: JsonhToken = token.value()
+                self.assertEqual(token_value.json_type, json_type)
+                self.assertEqual(token_value.value, value)
+        self.assertIsNone(next(tokens, None))
 
     def test_FindPropertyValueTest(self):
         jsonh: str = """
@@ -71,25 +80,25 @@ class JsonhPyTests(unittest.TestCase):
     # 
 
     def test_EscapeSequenceTest(self):
-        jsonh: str = """
-"\\U0001F47D and \\uD83D\\uDC7D"
+        jsonh: str = r"""
+"\U0001F47D and \uD83D\uDC7D"
 """
         element: str = cast(str, JsonhReader.parse_element_from_string(jsonh).value())
 
         self.assertEqual(element, "👽 and 👽")
 
     def test_QuotelessEscapeSequenceTest(self):
-        jsonh: str = """
-\\U0001F47D and \\uD83D\\uDC7D
+        jsonh: str = r"""
+\U0001F47D and \uD83D\uDC7D
 """
         element: str = cast(str, JsonhReader.parse_element_from_string(jsonh).value())
 
         self.assertEqual(element, "👽 and 👽")
 
     def test_MultiQuotedStringTest(self):
-        jsonh: str = '''
+        jsonh: str = r'''
 """"
-  Hello! Here's a quote: ". Now a double quote: "". And a triple quote! """. Escape: \\\\\\U0001F47D.
+  Hello! Here's a quote: ". Now a double quote: "". And a triple quote! """. Escape: \\\U0001F47D.
  """"
 '''
         element: str = cast(str, JsonhReader.parse_element_from_string(jsonh).value())
@@ -144,11 +153,11 @@ c : d
         self.assertEqual(element[3], 4)
 
     def test_VerbatimStringTest(self):
-        jsonh: str = """
+        jsonh: str = r"""
 {
-    a\\\\: b\\\\
-    @c\\\\: @d\\\\
-    @e\\\\: f\\\\
+    a\\: b\\
+    @c\\: @d\\
+    @e\\: f\\
 }
 """
         element: dict[str, str] = cast(dict[str, str], JsonhReader.parse_element_from_string(jsonh).value())
@@ -166,14 +175,51 @@ c : d
         self.assertEqual(element2["@c\\"], "@d\\")
         self.assertEqual(element2["@e\\"], "f\\")
 
-        jsonh2: str = """
-@"a\\\\": @'''b\\\\'''
+        jsonh2: str = r"""
+@"a\\": @'''b\\'''
 """
         element3: dict[str, str] = cast(dict[str, str], JsonhReader.parse_element_from_string(jsonh2).value())
 
         self.assertEqual(len(element3), 1)
         self.assertEqual(element3["a\\\\"], "b\\\\")
 
+    def test_StrictJsonTest(self):
+        jsonh: str = r"""
+{
+  "a": [1, -2.5, 1e3, true, false, null],
+  "b": { "c": "\u00e9\n" }
+}
+"""
+        element: object = JsonhReader.parse_element_from_string(jsonh).value()
+
+        self.assertEqual(element, JsonhReader(jsonh).parse_element().value())
+        self.assertIsInstance(cast(dict[str, list[object]], element)["a"][0], float)
+
+        self.assertTrue(JsonhReader.parse_element_from_string(jsonh, JsonhReaderOptions(
+            max_depth = 1,
+        )).is_error)
+
+        jsonh2: str = """
+[NaN, Infinity]
+"""
+        self.assertEqual(JsonhReader.parse_element_from_string(jsonh2).value(), ["NaN", "Infinity"])
+
+    def test_InternPropertyNamesTest(self):
+        jsonh: str = """
+[
+    { "name": "a" },
+    { "name": "b" },
+]
+"""
+        element: list[dict[str, str]] = cast(list[dict[str, str]], JsonhReader.parse_element_from_string(jsonh).value())
+
+        self.assertIs(next(iter(element[0])), next(iter(element[1])))
+
+        element2: list[dict[str, str]] = cast(list[dict[str, str]], JsonhReader.parse_element_from_string(jsonh, JsonhReaderOptions(
+            intern_property_names = False,
+        )).value())
+        self.assertEqual(element2, element)
+
     def test_ParseSingleElementTest(self):
         jsonh: str = """
 1
@@ -320,10 +366,10 @@ a: {
         self.assertEqual(element["a b"], "c d")
 
     def test_QuotelessStringsEscapeTest(self):
-        jsonh: str = """
-a: \\"5
-b: \\\\z
-c: 5 \\\\
+        jsonh: str = r"""
+a: \"5
+b: \\z
+c: 5 \\
 """
         element: dict[str, str] = cast(dict[str, str], JsonhReader.parse_element_from_string(jsonh).value())
 
@@ -351,8 +397,8 @@ c: 5 \\\\
         self.assertEqual(element, "  hello world\n  ")
 
     def test_QuotelessStringsEscapedLeadingTrailingWhitespaceTest(self):
-        jsonh: str = """
-\\nZ\\ \\r
+        jsonh: str = r"""
+\nZ\ \r
 """
         element: str = cast(str, JsonhReader.parse_element_from_string(jsonh).value())
 
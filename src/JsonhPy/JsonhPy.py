@@ -1,9 +1,15 @@
+import functools
 import math
-from enum import Enum
-from typing import Iterator, Iterable, cast
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Callable, Generator, Iterable, cast
 import json
+import re
+import sys
 
 class JsonhResult[T, E]:
+    __slots__ = ("is_error", "value_or_none", "error_or_none")
+
     is_error: bool
     value_or_none: T | None
     error_or_none: E | None
@@ -15,11 +21,11 @@ class JsonhResult[T, E]:
 
     @staticmethod
     def from_value[_T, _E](value: _T = None) -> "JsonhResult[_T, _E]": # type: ignore
-        return JsonhResult[_T, _E](False, value, None)
+        return JsonhResult(False, value, None)
 
     @staticmethod
     def from_error[_T, _E](error: _E = None) -> "JsonhResult[_T, _E]": # type: ignore
-        return JsonhResult[_T, _E](True, None, error)
+        return JsonhResult(True, None, error)
 
     def value(self) -> T:
         if self.is_error:
@@ -37,6 +43,8 @@ class JsonhResult[T, E]:
         return f"value ({self.value_or_none!r})"
 
 class JsonhRef[T]:
+    __slots__ = ("ref",)
+
     ref: T
 
     def __init__(self, ref: T) -> None:
@@ -59,7 +67,7 @@ class JsonhVersion(Enum):
     Version 2 of the specification, released 2025/11/19.
     """
 
-class JsonTokenType(Enum):
+class JsonTokenType(IntEnum):
     """
     The types of tokens that make up a JSON document.
     """
@@ -138,6 +146,8 @@ class JsonhToken:
     """
     A single JSONH token.
     """
+    __slots__ = ("json_type", "value")
+
     json_type: JsonTokenType
     value: str
 
@@ -151,8 +161,25 @@ class JsonhNumberParser:
 
     Unlike `JsonhReader.read_element()`, minimal validation is done here. Ensure the input is valid.
     """
+    _HEX_EXPONENT_REGEX = re.compile("[eE][-+]")
+    """
+    Matches the start of an exponent in a hexadecimal number, which needs a sign to tell it apart from the digit `e`.
+    """
+
     @staticmethod
     def parse(jsonh_number: str) -> JsonhResult[float, str]:
+        # Copy cached result (results are mutable)
+        number: JsonhResult[float, str] = JsonhNumberParser._parse_cached(jsonh_number)
+        return JsonhResult(number.is_error, number.value_or_none, number.error_or_none)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_cached(jsonh_number: str) -> JsonhResult[float, str]:
+        """
+        Parses a number, caching the result since the same numbers tend to repeat in a document.
+
+        The result is shared between calls and must not be modified.
+        """
         # Remove underscores
         jsonh_number = jsonh_number.replace("_", "")
         digits: str = jsonh_number
@@ -200,13 +227,9 @@ class JsonhNumberParser:
         exponent_index: int = -1
         # Hexadecimal exponent
         if 'e' in base_digits:
-            for index in range(0, len(digits)):
-                if digits[index] not in ['e', 'E']:
-                    continue
-                if index + 1 >= len(digits) or (digits[index + 1] not in ['-', '+']):
-                    continue
-                exponent_index = index
-                break
+            hex_exponent_match: re.Match[str] | None = JsonhNumberParser._HEX_EXPONENT_REGEX.search(digits)
+            if hex_exponent_match != None:
+                exponent_index = hex_exponent_match.start()
         # Exponent
         else:
             exponent_index = JsonhNumberParser._index_of_any(digits, ['e', 'E'])
@@ -289,19 +312,23 @@ class JsonhNumberParser:
             sign = 1
             digits = digits[1:]
 
-        # Add each column of digits
+        # Convert short decimal integers directly (exact in a float)
         integer: float = 0.0
-        for index in range(0, len(digits)):
-            # Get current digit
-            digit_char: str = digits[index]
-            digit_int: int = base_digits.find(digit_char.lower())
+        if len(digits) <= 15 and base_digits == "0123456789" and digits.isascii() and digits.isdigit():
+            integer = float(int(digits))
+        # Add each column of digits
+        else:
+            for index in range(0, len(digits)):
+                # Get current digit
+                digit_char: str = digits[index]
+                digit_int: int = base_digits.find(digit_char.lower())
 
-            # Ensure digit is valid
-            if digit_int < 0:
-                return JsonhResult.from_error(f"Invalid digit: '{digit_char}'")
+                # Ensure digit is valid
+                if digit_int < 0:
+                    return JsonhResult.from_error(f"Invalid digit: '{digit_char}'")
 
-            # Add value of column
-            integer = (integer * len(base_digits)) + digit_int
+                # Add value of column
+                integer = (integer * len(base_digits)) + digit_int
 
         # Apply sign
         if sign != 1:
@@ -310,12 +337,10 @@ class JsonhNumberParser:
 
     @staticmethod
     def _index_of_any(input: str, chars: Iterable[str]) -> int:
-        for i in range(0, len(input)):
-            char: str = input[i]
-            if char in chars:
-                return i
-        return -1
+        indexes: list[int] = [index for char in chars if (index := input.find(char)) >= 0]
+        return min(indexes, default=-1)
 
+@dataclass(eq=False, slots=True)
 class JsonhReaderOptions:
     """
     Options for a JsonhReader.
@@ -365,15 +390,19 @@ class JsonhReaderOptions:
     
     Only some tokens can be incomplete in this mode, so it should not be relied upon.
     """
+    intern_property_names: bool = True
+    """
+    Enables/disables interning property names with `sys.intern` when parsing elements.
 
-    def __init__(self, version: JsonhVersion = JsonhVersion.LATEST, parse_single_element: bool = False, max_depth: int = 64, incomplete_inputs: bool = False) -> None:
-        """
-        Constructs options for a JsonhReader.
-        """
-        self.version = version
-        self.parse_single_element = parse_single_element
-        self.max_depth = max_depth
-        self.incomplete_inputs = incomplete_inputs
+    ```
+    [
+      { "name": "a" },
+      { "name": "b" } // Both objects share the same "name" string
+    ]
+    ```
+
+    This saves memory and speeds up dictionary lookups when the same property names are repeated many times.
+    """
 
     def supports_version(self, minimum_version: JsonhVersion) -> bool:
         """
@@ -387,6 +416,30 @@ class JsonhReaderOptions:
 
         return options_version.value >= given_version.value
 
+class _JsonhParseState:
+    """
+    The elements being built by `JsonhReader.parse_element()`.
+    """
+    __slots__ = ("elements", "property_name", "intern_property_names")
+
+    elements: list[object]
+    """
+    The stack of objects and arrays currently being parsed.
+    """
+    property_name: str | None
+    """
+    The name of the property whose value is being parsed, if any.
+    """
+    intern_property_names: bool
+    """
+    Whether property names are interned with `sys.intern`.
+    """
+
+    def __init__(self, intern_property_names: bool) -> None:
+        self.elements = []
+        self.property_name = None
+        self.intern_property_names = intern_property_names
+
 class JsonhReader:
     """
     A reader that reads JSONH tokens from a `str`.
@@ -403,170 +456,369 @@ class JsonhReader:
     """
     The options to use when reading JSONH.
     """
-    char_counter: int
-    """
-    The number of characters read from the string.
-    """
     depth: int
     """
     The current recursion depth of the reader.
     """
+    _string_length: int
+    """
+    The length of the string.
+    """
+    _supports_v2: bool
+    """
+    Whether the options version supports JSONH V2.
+    """
+    _reserved_chars: frozenset[str]
+    """
+    Characters that cannot be used unescaped in quoteless strings (resolved from the options version).
+    """
+    _quoteless_stop_regex: re.Pattern[str]
+    """
+    Matches the next reserved character, newline or escape sequence in a quoteless string (resolved from the options version).
+    """
 
-    def _RESERVED_CHARS(self):
-        """
-        Characters that cannot be used unescaped in quoteless strings.
-        """
-        return self._RESERVED_CHARS_V2 if self.options.supports_version(JsonhVersion.V2) else self._RESERVED_CHARS_V1
-
-    _RESERVED_CHARS_V1 = set(['\\', ',', ':', '[', ']', '{', '}', '/', '#', '"', '\''])
+    _RESERVED_CHARS_V1 = frozenset({'\\', ',', ':', '[', ']', '{', '}', '/', '#', '"', '\''})
     """
     Characters that cannot be used unescaped in quoteless strings in JSONH V1.
     """
-    _RESERVED_CHARS_V2 = set(['\\', ',', ':', '[', ']', '{', '}', '/', '#', '"', '\'', '@'])
+    _RESERVED_CHARS_V2 = frozenset({'\\', ',', ':', '[', ']', '{', '}', '/', '#', '"', '\'', '@'})
     """
     Characters that cannot be used unescaped in quoteless strings in JSONH V2.
     """
-    _NEWLINE_CHARS = set(['\n', '\r', '\u2028', '\u2029'])
+    _QUOTELESS_STOP_REGEX_V1 = re.compile("[" + re.escape("".join(_RESERVED_CHARS_V1)) + "\n\r\u2028\u2029]")
+    """
+    Matches the next reserved character, newline or escape sequence in a quoteless string in JSONH V1.
+    """
+    _QUOTELESS_STOP_REGEX_V2 = re.compile("[" + re.escape("".join(_RESERVED_CHARS_V2)) + "\n\r\u2028\u2029]")
+    """
+    Matches the next reserved character, newline or escape sequence in a quoteless string in JSONH V2.
+    """
+    _NEWLINE_CHARS = frozenset({'\n', '\r', '\u2028', '\u2029'})
     """
     Characters that are considered newlines.
     """
-    _WHITESPACE_CHARS = set([
+    _WHITESPACE_CHARS = frozenset({
         '\u0020', '\u00A0', '\u1680', '\u2000', '\u2001', '\u2002', '\u2003', '\u2004', '\u2005',
         '\u2006', '\u2007', '\u2008', '\u2009', '\u200A', '\u202F', '\u205F', '\u3000', '\u2028',
         '\u2029', '\u0009', '\u000A', '\u000B', '\u000C', '\u000D', '\u0085',
-    ])
+    })
     """
     Characters that are considered whitespace.
     """
+    _WHITESPACE_STRING = "".join(_WHITESPACE_CHARS)
+    """
+    Characters that are considered whitespace, as a string for `str.strip()`.
+    """
+    _LEADING_WHITESPACE_NEWLINE_REGEX = re.compile("[" + re.escape("".join(_WHITESPACE_CHARS - _NEWLINE_CHARS)) + "]*(?:\r\n|[" + re.escape("".join(_NEWLINE_CHARS)) + "])")
+    """
+    Matches leading whitespace followed by a newline in a multi-quoted string.
+    """
+    _TRAILING_NEWLINE_WHITESPACE_REGEX = re.compile("(?:\r\n|[" + re.escape("".join(_NEWLINE_CHARS)) + "])([" + re.escape("".join(_WHITESPACE_CHARS - _NEWLINE_CHARS)) + "]*)\\Z")
+    """
+    Matches the last newline followed by trailing whitespace in a multi-quoted string.
+    """
+    _LINE_LEADING_WHITESPACE_PATTERN = (
+        "(?<![^" + re.escape("".join(_NEWLINE_CHARS)) + "])(?:"
+        + "[" + re.escape("".join(_WHITESPACE_CHARS - _NEWLINE_CHARS)) + "]{{{count}}}|"
+        + "[" + re.escape("".join(_WHITESPACE_CHARS - _NEWLINE_CHARS)) + "]{{0,{partial_count}}}(?=[^" + re.escape("".join(_WHITESPACE_CHARS)) + "]))"
+    )
+    """
+    Pattern (formatted with `count` and `partial_count = count - 1`) matching the whitespace to strip from the start of each line in a multi-quoted string:
+    up to `count` whitespace characters, or fewer if a non-whitespace character follows.
+    """
+    _NON_JSON_REGEX = re.compile(r"[#'@/]|\\u[dD][89abAB]")
+    """
+    Matches characters that may be JSONH syntax outside of strict JSON, and high surrogate escapes (which JSONH pairs more strictly than JSON).
+    """
+    _ELEMENT_KINDS: dict[str, str] = {
+        '{': "object",
+        '[': "array",
+        **dict.fromkeys("0123456789+-.", "number"),
+        '"': "string",
+        '\'': "string",
+        '@': "verbatim_string",
+    }
+    """
+    The kind of element started by each character (other characters start quoteless strings).
+    """
+    _ESCAPE_SEQUENCES: dict[str, str] = {
+        '\\': '\\', # Reverse solidus
+        'b': '\b', # Backspace
+        'f': '\f', # Form feed
+        'n': '\n', # Newline
+        'r': '\r', # Carriage return
+        't': '\t', # Tab
+        'v': '\v', # Vertical tab
+        '0': '\0', # Null
+        'a': '\a', # Alert
+        'e': '\u001b', # Escape
+    }
+    """
+    Single-character escape sequences and the characters they represent.
+    """
+    _HEX_ESCAPE_SEQUENCE_LENGTHS: dict[str, int] = {
+        'u': 4, # Unicode hex sequence
+        'x': 2, # Short unicode hex sequence
+        'U': 8, # Long unicode hex sequence
+    }
+    """
+    Hex escape sequences and the number of hex digits they take.
+    """
+    _QUOTE_RUN_REGEXES: dict[str, re.Pattern[str]] = {
+        '"': re.compile('"*'),
+        '\'': re.compile("'*"),
+    }
+    """
+    Matches a run of quotes, by quote.
+    """
+    _STRING_STOP_REGEXES: dict[str, re.Pattern[str]] = {
+        '"': re.compile(r'"+|\\'),
+        '\'': re.compile(r"'+|\\"),
+    }
+    """
+    Matches the next run of quotes or escape in a quoted string, by start quote.
+    """
+    _HEX_DIGITS_REGEX = re.compile("[0-9A-Fa-f]*")
+    """
+    Matches a run of hexadecimal digits.
+    """
+    _JSON_INTEGER_REGEX = re.compile("-?(?:0|[1-9][0-9]{0,14})")
+    """
+    Matches a JSON integer with at most 15 digits, which a float represents exactly.
+    """
+    _JSON_ESCAPE_REGEX = re.compile(r'["\\\x00-\x1f]')
+    """
+    Matches characters that `json.dumps()` escapes when `ensure_ascii` is false.
+    """
+    _COMMENT_START_CHARS = frozenset({'#', '/'})
+    """
+    Characters that can start a comment.
+    """
+    _WHITESPACE_REGEX = re.compile("[" + re.escape("".join(_WHITESPACE_CHARS)) + "]*")
+    """
+    Matches a run of whitespace characters.
+    """
+    _INLINE_WHITESPACE_REGEX = re.compile("[" + re.escape("".join(_WHITESPACE_CHARS - _NEWLINE_CHARS)) + "]*")
+    """
+    Matches a run of whitespace characters that are not newlines.
+    """
+    _NEST_COUNTER_REGEX = re.compile("=*")
+    """
+    Matches the run of `=` that sets the nesting level of a nestable block comment.
+    """
+    _LINE_COMMENT_REGEX = re.compile("[^" + re.escape("".join(_NEWLINE_CHARS)) + "]*")
+    """
+    Matches the contents of a line comment up to the next newline.
+    """
 
     def __init__(self, string: str, options: JsonhReaderOptions = JsonhReaderOptions()) -> None:
         """
         Constructs a reader that reads JSONH from a string.
         """
         self.string = string
+        self._string_length = len(string)
         self.string_index = 0
         self.options = options
-        self.char_counter = 0
         self.depth = 0
+        self._supports_v2 = options.supports_version(JsonhVersion.V2)
+        self._reserved_chars = self._RESERVED_CHARS_V2 if self._supports_v2 else self._RESERVED_CHARS_V1
+        self._quoteless_stop_regex = self._QUOTELESS_STOP_REGEX_V2 if self._supports_v2 else self._QUOTELESS_STOP_REGEX_V1
 
-    @staticmethod
-    def parse_element_from_string(string: str, options: JsonhReaderOptions = JsonhReaderOptions()) -> JsonhResult[object, str]:
+    @property
+    def char_counter(self) -> int:
         """
-        Parses a single element from a string.
+        The number of characters read from the string.
         """
-        return JsonhReader(string, options).parse_element()
+        return self.string_index
 
-    def parse_element(self) -> JsonhResult[object, str]:
+    @staticmethod
+    def parse_element_from_string(string: str, options: JsonhReaderOptions = JsonhReaderOptions()) -> JsonhResult[object, str]:
         """
-        Parses a single element from the reader.
+        Parses a single element from a string.
         """
-        current_elements: list[object] = []
-        current_property_name: str | None = None
+        # Strict JSON (parse with standard library)
+        if JsonhReader._NON_JSON_REGEX.search(string) == None:
+            try:
+                element: object = json.loads(
+                    string,
+                    parse_int=JsonhReader._parse_json_number,
+                    parse_float=JsonhReader._parse_json_number,
+                    parse_constant=JsonhReader._reject_json_constant,
+                    object_pairs_hook=JsonhReader._intern_json_object if options.intern_property_names else None,
+                )
+                # Ensure max depth not exceeded
+                if string.count('{') + string.count('[') <= options.max_depth or JsonhReader._get_depth(element) <= options.max_depth:
+                    return JsonhResult.from_value(element)
+            except (ValueError, RecursionError):
+                pass
 
-        def submit_element(element: object) -> bool:
-            nonlocal current_elements
-            nonlocal current_property_name
+        # JSONH
+        return JsonhReader(string, options).parse_element()
 
-            # Root value
-            if len(current_elements) == 0:
-                return True
-            # Array item
-            if current_property_name == None:
-                current_array: list[object] = cast(list[object], current_elements[-1])
-                current_array.append(element)
-                return False
-            # Object property
-            else:
-                current_object: dict[str, object] = cast(dict[str, object], current_elements[-1])
-                current_object[current_property_name] = element
-                current_property_name = None
-                return False
+    @staticmethod
+    def _parse_json_number(json_number: str) -> float:
+        return JsonhNumberParser.parse(json_number).value()
 
-        def start_element(element: object | None) -> None:
-            nonlocal current_elements
-            nonlocal submit_element
+    @staticmethod
+    def _reject_json_constant(json_constant: str) -> object:
+        # NaN and Infinity are quoteless strings in JSONH
+        raise ValueError(f"Unexpected constant: {json_constant}")
 
-            submit_element(element)
-            current_elements.append(element)
+    @staticmethod
+    def _intern_json_object(pairs: list[tuple[str, object]]) -> dict[str, object]:
+        return {sys.intern(key): value for key, value in pairs}
 
-        def parse_next_element() -> JsonhResult[object, str]:
-            nonlocal self
-            nonlocal current_property_name
+    @staticmethod
+    def _get_depth(element: object) -> int:
+        max_depth: int = 0
+        pending: list[tuple[object, int]] = [(element, 1)]
+        while len(pending) > 0:
+            current_element, current_depth = pending.pop()
+            # Object
+            if isinstance(current_element, dict):
+                children: Iterable[object] = cast(dict[str, object], current_element).values()
+            # Array
+            elif isinstance(current_element, list):
+                children = cast(list[object], current_element)
+            # Primitive
+            else:
+                continue
+            max_depth = max(max_depth, current_depth)
+            for child in children:
+                pending.append((child, current_depth + 1))
+        return max_depth
 
-            for token_result in self.read_element():
-                # Check error
-                if token_result.is_error:
-                    return JsonhResult.from_error(token_result.error())
+    def parse_element(self) -> JsonhResult[object, str]:
+        """
+        Parses a single element from the reader.
+        """
+        options: JsonhReaderOptions = self.options
+        state: _JsonhParseState = _JsonhParseState(options.intern_property_names)
+        token_handlers: dict[JsonTokenType, Callable[[_JsonhParseState, JsonhToken], JsonhResult[object, str] | None]] = self._PARSE_TOKEN_HANDLERS
+        next_element: JsonhResult[object, str] = JsonhResult.from_error("Expected token, got end of input")
 
-                match token_result.value().json_type:
-                    # Null
-                    case JsonTokenType.NULL:
-                        element_null: None = None
-                        if submit_element(element_null):
-                            return JsonhResult.from_value(element_null)
-                    # True
-                    case JsonTokenType.TRUE:
-                        element_true: bool = True
-                        if submit_element(element_true):
-                            return JsonhResult.from_value(element_true)
-                    # False
-                    case JsonTokenType.FALSE:
-                        element_false: bool = False
-                        if submit_element(element_false):
-                            return JsonhResult.from_value(element_false)
-                    # String
-                    case JsonTokenType.STRING:
-                        element_string: str = token_result.value().value
-                        if submit_element(element_string):
-                            return JsonhResult.from_value(element_string)
-                    # Number
-                    case JsonTokenType.NUMBER:
-                        result: JsonhResult[float, str] = JsonhNumberParser.parse(token_result.value().value)
-                        if result.is_error:
-                            return JsonhResult.from_error(result.error())
-                        element_number: float = result.value()
-                        if submit_element(element_number):
-                            return JsonhResult.from_value(element_number)
-                    # Start Object
-                    case JsonTokenType.START_OBJECT:
-                        element_object: dict[str, object] = {}
-                        start_element(element_object)
-                    # Start Array
-                    case JsonTokenType.START_ARRAY:
-                        element_array: list[object] = []
-                        start_element(element_array)
-                    # End Object/Array
-                    case JsonTokenType.END_OBJECT | JsonTokenType.END_ARRAY:
-                        # Nested element
-                        if len(current_elements) > 1:
-                            current_elements.pop()
-                        # Root element
-                        else:
-                            return JsonhResult.from_value(current_elements[-1])
-                    # Property Name
-                    case JsonTokenType.PROPERTY_NAME:
-                        current_property_name = token_result.value().value
-                    # Comment
-                    case JsonTokenType.COMMENT:
-                        pass
-                    # Not Implemented
-                    case _:
-                        return JsonhResult.from_error("Token type not implemented")
+        for token_result in self.read_element():
+            # Check error
+            if token_result.is_error:
+                next_element = JsonhResult.from_error(token_result.error())
+                break
 
-            # End of input
-            return JsonhResult.from_error("Expected token, got end of input")
+            # Get token handler
+            token: JsonhToken = token_result.value()
+            token_handler: Callable[[_JsonhParseState, JsonhToken], JsonhResult[object, str] | None] | None = token_handlers.get(token.json_type)
+            if token_handler == None:
+                next_element = JsonhResult.from_error("Token type not implemented")
+                break
 
-        next_element: JsonhResult[object, str] = parse_next_element()
+            # Handle token
+            element: JsonhResult[object, str] | None = token_handler(state, token)
+            if element != None:
+                next_element = element
+                break
 
         # Ensure exactly one element
         if not next_element.is_error:
-            if self.options.parse_single_element:
+            if options.parse_single_element:
                 for token in self.read_end_of_elements():
                     if token.is_error:
                         return JsonhResult.from_error(token.error())
 
         return next_element
 
+    @staticmethod
+    def _submit_element(state: _JsonhParseState, element: object) -> JsonhResult[object, str] | None:
+        # Root value
+        if len(state.elements) == 0:
+            return JsonhResult.from_value(element)
+        # Array item
+        if state.property_name == None:
+            current_array: list[object] = cast(list[object], state.elements[-1])
+            current_array.append(element)
+            return None
+        # Object property
+        else:
+            current_object: dict[str, object] = cast(dict[str, object], state.elements[-1])
+            current_object[state.property_name] = element
+            state.property_name = None
+            return None
+
+    @staticmethod
+    def _start_element(state: _JsonhParseState, element: object) -> None:
+        JsonhReader._submit_element(state, element)
+        state.elements.append(element)
+
+    @staticmethod
+    def _parse_null_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        return JsonhReader._submit_element(state, None)
+
+    @staticmethod
+    def _parse_true_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        return JsonhReader._submit_element(state, True)
+
+    @staticmethod
+    def _parse_false_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        return JsonhReader._submit_element(state, False)
+
+    @staticmethod
+    def _parse_string_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        return JsonhReader._submit_element(state, token.value)
+
+    @staticmethod
+    def _parse_number_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        result: JsonhResult[float, str] = JsonhNumberParser.parse(token.value)
+        if result.is_error:
+            return JsonhResult.from_error(result.error())
+        return JsonhReader._submit_element(state, result.value())
+
+    @staticmethod
+    def _parse_start_object_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        JsonhReader._start_element(state, {})
+        return None
+
+    @staticmethod
+    def _parse_start_array_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        JsonhReader._start_element(state, [])
+        return None
+
+    @staticmethod
+    def _parse_end_structure_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        # Nested element
+        if len(state.elements) > 1:
+            state.elements.pop()
+            return None
+        # Root element
+        else:
+            return JsonhResult.from_value(state.elements[-1])
+
+    @staticmethod
+    def _parse_property_name_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        if state.intern_property_names:
+            state.property_name = sys.intern(token.value)
+        else:
+            state.property_name = token.value
+        return None
+
+    @staticmethod
+    def _parse_comment_token(state: _JsonhParseState, token: JsonhToken) -> JsonhResult[object, str] | None:
+        return None
+
+    _PARSE_TOKEN_HANDLERS: dict[JsonTokenType, Callable[[_JsonhParseState, JsonhToken], JsonhResult[object, str] | None]] = {
+        JsonTokenType.NULL: _parse_null_token,
+        JsonTokenType.TRUE: _parse_true_token,
+        JsonTokenType.FALSE: _parse_false_token,
+        JsonTokenType.STRING: _parse_string_token,
+        JsonTokenType.NUMBER: _parse_number_token,
+        JsonTokenType.START_OBJECT: _parse_start_object_token,
+        JsonTokenType.START_ARRAY: _parse_start_array_token,
+        JsonTokenType.END_OBJECT: _parse_end_structure_token,
+        JsonTokenType.END_ARRAY: _parse_end_structure_token,
+        JsonTokenType.PROPERTY_NAME: _parse_property_name_token,
+        JsonTokenType.COMMENT: _parse_comment_token,
+    }
+    """
+    The handlers used by `parse_element()` for each token type.
+    """
+
     def parse_json(self, include_comments: bool = False, indent: str | None = None) -> JsonhResult[str, str]:
         """
         Parses a single element as JSON from the reader.
@@ -583,7 +835,7 @@ class JsonhReader:
             is_start_of_structure: bool = True
             is_property_value: bool = False
 
-            result_builder: str = ""
+            result_builder: list[str] = []
 
             for token_result in self.read_element():
                 # Check error
@@ -597,7 +849,7 @@ class JsonhReader:
                     if (token.json_type not in [JsonTokenType.NONE, JsonTokenType.COMMENT]) and (current_depth > 0) and (not is_start_of_structure):
                         # Don't add trailing comma
                         if token.json_type not in [JsonTokenType.END_OBJECT, JsonTokenType.END_ARRAY]:
-                            result_builder += ','
+                            result_builder.append(',')
 
                     # Apply indentation
                     if indent != None:
@@ -608,7 +860,7 @@ class JsonhReader:
                                 # Don't indent root elements
                                 if current_depth > 0:
                                     # Add newline before element
-                                    result_builder += '\n'
+                                    result_builder.append('\n')
 
                                     # Get current indent count
                                     indent_count: int = current_depth
@@ -616,8 +868,7 @@ class JsonhReader:
                                         indent_count -= 1
 
                                     # Add indent
-                                    for _ in range(0, indent_count):
-                                        result_builder += indent
+                                    result_builder.append(indent * indent_count)
                 # Track start of structure to avoid adding leading comma
                 if token.json_type not in [JsonTokenType.NONE, JsonTokenType.COMMENT]:
                     is_start_of_structure = False
@@ -627,64 +878,68 @@ class JsonhReader:
                 match token.json_type:
                     # Null
                     case JsonTokenType.NONE:
-                        result_builder += "null"
+                        result_builder.append("null")
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # True
                     case JsonTokenType.TRUE:
-                        result_builder += "true"
+                        result_builder.append("true")
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # False
                     case JsonTokenType.FALSE:
-                        result_builder += "false"
+                        result_builder.append("false")
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # String
                     case JsonTokenType.STRING:
-                        result_builder += json.dumps(token.value, ensure_ascii=False)
+                        result_builder.append(self._to_json_string(token.value))
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # Number
                     case JsonTokenType.NUMBER:
-                        result: JsonhResult[float, str] = JsonhNumberParser.parse(token_result.value().value)
-                        if result.is_error:
-                            return JsonhResult.from_error(result.error())
-                        result_builder += str(result.value()).removesuffix(".0")
+                        # Integers that are exact in a float are already valid JSON
+                        if self._JSON_INTEGER_REGEX.fullmatch(token.value) != None:
+                            result_builder.append(token.value)
+                        else:
+                            result: JsonhResult[float, str] = JsonhNumberParser.parse(token.value)
+                            if result.is_error:
+                                return JsonhResult.from_error(result.error())
+                            result_builder.append(str(result.value()).removesuffix(".0"))
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # Start Object
                     case JsonTokenType.START_OBJECT:
-                        result_builder += '{'
+                        result_builder.append('{')
                         current_depth += 1
                     # Start Array
                     case JsonTokenType.START_ARRAY:
-                        result_builder += '['
+                        result_builder.append('[')
                         current_depth += 1
                     # End Object
                     case JsonTokenType.END_OBJECT:
-                        result_builder += '}'
+                        result_builder.append('}')
                         current_depth -= 1
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # End Array
                     case JsonTokenType.END_ARRAY:
-                        result_builder += ']'
+                        result_builder.append(']')
                         current_depth -= 1
                         if current_depth == 0:
-                            return JsonhResult.from_value(result_builder)
+                            return JsonhResult.from_value("".join(result_builder))
                     # Property Name
                     case JsonTokenType.PROPERTY_NAME:
-                        result_builder += json.dumps(token.value, ensure_ascii=False)
-                        result_builder += ':'
+                        result_builder.append(self._to_json_string(token.value))
+                        result_builder.append(':')
                         if indent != None:
-                            result_builder += ' '
+                            result_builder.append(' ')
                     # Comment
                     case JsonTokenType.COMMENT:
                         if include_comments:
-                            result_builder += "/*"
-                            result_builder += token.value.replace("/*", "/ *").replace("*/", "* /")
-                            result_builder += "*/"
+                            result_builder.append("/*")
+                            result_builder.append(token.value.replace("/*", "/ *").replace("*/", "* /"))
+                            result_builder.append("*/")
                     # Not implemented
                     case _:
                         return JsonhResult.from_error("Token type not implemented")
@@ -706,6 +961,13 @@ class JsonhReader:
 
         return next_element_as_json
 
+    @staticmethod
+    def _to_json_string(string: str) -> str:
+        # Quote directly if nothing needs escaping
+        if JsonhReader._JSON_ESCAPE_REGEX.search(string) == None:
+            return '"' + string + '"'
+        return json.dumps(string, ensure_ascii=False)
+
     def find_property_value(self, property_name: str) -> bool:
         """
         Tries to find the given property name in the reader.
@@ -754,75 +1016,63 @@ class JsonhReader:
         # Peek char
         return self._peek() != None
 
-    def read_end_of_elements(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def read_end_of_elements(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         """
         Reads comments and whitespace and errors if the reader contains another element.
         """
         # Comments & whitespace
-        for token in self._read_comments_and_whitespace():
-            if token.is_error:
-                yield JsonhResult.from_error(token.error())
-                return
-            yield token
+        if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+            return True
         
         # Peek char
         if self._peek() != None:
             yield JsonhResult.from_error("Expected end of elements")
 
-    def read_element(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def read_element(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         """
         Reads a single element from the reader.
         """
         # Comments & whitespace
-        for token in self._read_comments_and_whitespace():
-            if token.is_error:
-                yield JsonhResult.from_error(token.error())
-                return
-            yield token
+        if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+            return True
 
         # Peek char
-        next: str | None = self._peek()
-        if next == None:
+        if self.string_index >= self._string_length:
             yield JsonhResult.from_error("Expected token, got end of input")
-            return
+            return True
+
+        # Get kind of element from first char
+        element_kind: str | None = self._ELEMENT_KINDS.get(self.string[self.string_index])
 
         # Object
-        if next == '{':
-            for token in self._read_object():
-                if token.is_error:
-                    yield JsonhResult.from_error(token.error())
-                    return
-                yield token
+        if element_kind == "object":
+            if (yield from self._read_object()):
+                return True
         # Array
-        elif next == '[':
-            for token in self._read_array():
-                if token.is_error:
-                    yield JsonhResult.from_error(token.error())
-                    return
-                yield token
+        elif element_kind == "array":
+            if (yield from self._read_array()):
+                return True
         # Primitive value (null, true, false, string, number)
         else:
-            token: JsonhResult[JsonhToken, str] = self._read_primitive_element()
+            token: JsonhResult[JsonhToken, str] = self._read_primitive_element(element_kind)
             if token.is_error:
                 yield JsonhResult.from_error(token.error())
-                return
+                return True
 
-            # Detect braceless object from property name
-            for token2 in self._read_braceless_object_or_end_of_primitive(token.value()):
-                if token2.is_error:
-                    yield token2
-                    return
-                yield token2
+            # Detect braceless object from property name (only if a comment or colon follows)
+            if self._read_whitespace_before_comment() or self._peek() == ':':
+                if (yield from self._read_braceless_object_or_end_of_primitive(token.value())):
+                    return True
+            # End of primitive
+            else:
+                yield token
 
-    def _read_object(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_object(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         # Opening brace
         if not self._read_one('{'):
             # Braceless object
-            for token in self._read_braceless_object():
-                if token.is_error:
-                    yield token
-                    return
-                yield token
+            if (yield from self._read_braceless_object()):
+                return True
         # Start of object
         yield JsonhResult.from_value(JsonhToken(JsonTokenType.START_OBJECT))
         self.depth += 1
@@ -830,15 +1080,12 @@ class JsonhReader:
         # Check exceeded max depth
         if self.depth > self.options.max_depth:
             yield JsonhResult.from_error("Exceeded max depth")
-            return
+            return True
 
         while True:
             # Comments & whitespace
-            for token in self._read_comments_and_whitespace():
-                if token.is_error:
-                    yield token
-                    return
-                yield token
+            if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+                return True
 
             next: str | None = self._peek()
             if next == None:
@@ -849,7 +1096,7 @@ class JsonhReader:
                     return
                 # Missing closing brace
                 yield JsonhResult.from_error("Expected `}` to end object, got end of input")
-                return
+                return True
 
             # Closing brace
             if next == '}':
@@ -860,13 +1107,10 @@ class JsonhReader:
                 return
             # Property
             else:
-                for token in self._read_property():
-                    if token.is_error:
-                        yield token
-                        return
-                    yield token
+                if (yield from self._read_property()):
+                    return True
 
-    def _read_braceless_object(self, property_name_tokens: Iterable[JsonhToken] | None = None) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_braceless_object(self, property_name_tokens: Iterable[JsonhToken] | None = None) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         # Start of object
         yield JsonhResult.from_value(JsonhToken(JsonTokenType.START_OBJECT))
         self.depth += 1
@@ -874,23 +1118,17 @@ class JsonhReader:
         # Check exceeded max depth
         if self.depth > self.options.max_depth:
             yield JsonhResult.from_error("Exceeded max depth")
-            return
+            return True
 
         # Initial tokens
         if property_name_tokens != None:
-            for initial_token in self._read_property(property_name_tokens):
-                if initial_token.is_error:
-                    yield initial_token
-                    return
-                yield initial_token
+            if (yield from self._read_property(property_name_tokens)):
+                return True
         
         while True:
             # Comments & whitespace
-            for token in self._read_comments_and_whitespace():
-                if token.is_error:
-                    yield token
-                    return
-                yield token
+            if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+                return True
             
             if self._peek() == None:
                 # End of braceless object
@@ -899,19 +1137,16 @@ class JsonhReader:
                 return
             
             # Property
-            for token in self._read_property():
-                if token.is_error:
-                    yield token
-                    return
-                yield token
+            if (yield from self._read_property()):
+                return True
 
-    def _read_braceless_object_or_end_of_primitive(self, primitive_token: JsonhToken) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_braceless_object_or_end_of_primitive(self, primitive_token: JsonhToken) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         # Comments & whitespace
         property_name_tokens: list[JsonhToken] | None = None
         for comment_or_whitespace_token in self._read_comments_and_whitespace():
             if comment_or_whitespace_token.is_error:
                 yield comment_or_whitespace_token
-                return
+                return True
             if property_name_tokens == None:
                 property_name_tokens = []
             property_name_tokens.append(comment_or_whitespace_token.value())
@@ -933,74 +1168,56 @@ class JsonhReader:
         property_name_tokens.append(JsonhToken(JsonTokenType.PROPERTY_NAME, primitive_token.value))
 
         # Braceless object
-        for object_token in self._read_braceless_object(property_name_tokens):
-            if object_token.is_error:
-                yield object_token
-                return
-            yield object_token
+        if (yield from self._read_braceless_object(property_name_tokens)):
+            return True
 
-    def _read_property(self, property_name_tokens: Iterable[JsonhToken] | None = None) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_property(self, property_name_tokens: Iterable[JsonhToken] | None = None) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         if property_name_tokens != None:
             for token in property_name_tokens:
                 yield JsonhResult.from_value(token)
         else:
-            for token in self._read_property_name():
-                if token.is_error:
-                    yield token
-                    return
-                yield token
+            if (yield from self._read_property_name()):
+                return True
 
         # Comments & whitespace
-        for token in self._read_comments_and_whitespace():
-            if token.is_error:
-                yield token
-                return
-            yield token
+        if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+            return True
         
         # Property value
-        for token in self.read_element():
-            if token.is_error:
-                yield token
-                return
-            yield token
+        if (yield from self.read_element()):
+            return True
 
         # Comments & whitespace
-        for token in self._read_comments_and_whitespace():
-            if token.is_error:
-                yield token
-                return
-            yield token
+        if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+            return True
 
         # Optional comma
         self._read_one(',')
 
-    def _read_property_name(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_property_name(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         # String
         string_token: JsonhResult[JsonhToken, str] = self._read_string()
         if string_token.is_error:
             yield string_token
-            return
+            return True
         
         # Comments & whitespace
-        for token in self._read_comments_and_whitespace():
-            if token.is_error:
-                yield token
-                return
-            yield token
+        if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+            return True
 
         # Colon
         if not self._read_one(':'):
             yield JsonhResult.from_error("Expected `:` after property name in object")
-            return
+            return True
 
         # End of property name
         yield JsonhResult.from_value(JsonhToken(JsonTokenType.PROPERTY_NAME, string_token.value().value))
 
-    def _read_array(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_array(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         # Opening bracket
         if not self._read_one('['):
             yield JsonhResult.from_error("Expected `[` to start array")
-            return
+            return True
         # Start of array
         yield JsonhResult.from_value(JsonhToken(JsonTokenType.START_ARRAY))
         self.depth += 1
@@ -1008,15 +1225,12 @@ class JsonhReader:
         # Check exceeded max depth
         if self.depth > self.options.max_depth:
             yield JsonhResult.from_error("Exceeded max depth")
-            return
+            return True
 
         while True:
             # Comments & whitespace
-            for token in self._read_comments_and_whitespace():
-                if token.is_error:
-                    yield token
-                    return
-                yield token
+            if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+                return True
 
             next: str | None = self._peek()
             if next == None:
@@ -1027,7 +1241,7 @@ class JsonhReader:
                     return
                 # Missing closing bracket
                 yield JsonhResult.from_error("Expected `]` to end array, got end of input")
-                return
+                return True
             
             # Closing bracket
             if next == ']':
@@ -1038,26 +1252,17 @@ class JsonhReader:
                 return
             # Item
             else:
-                for token in self._read_item():
-                    if token.is_error:
-                        yield token
-                        return
-                    yield token
+                if (yield from self._read_item()):
+                    return True
 
-    def _read_item(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_item(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
         # Element
-        for token in self.read_element():
-            if token.is_error:
-                yield token
-                return
-            yield token
+        if (yield from self.read_element()):
+            return True
 
         # Comments & whitespace
-        for token in self._read_comments_and_whitespace():
-            if token.is_error:
-                yield token
-                return
-            yield token
+        if self._read_whitespace_before_comment() and (yield from self._read_comments_and_whitespace()):
+            return True
 
         # Optional comma
         self._read_one(',')
@@ -1065,7 +1270,7 @@ class JsonhReader:
     def _read_string(self) -> JsonhResult[JsonhToken, str]:
         # Verbatim
         is_verbatim: bool = False
-        if self.options.supports_version(JsonhVersion.V2) and self._read_one('@'):
+        if self._supports_v2 and self._read_one('@'):
             is_verbatim = True
 
             # Ensure string immediately follows verbatim symbol
@@ -1079,103 +1284,75 @@ class JsonhReader:
             return self._read_quoteless_string("", is_verbatim)
 
         # Count multiple quotes
-        start_quote_counter: int = 1
-        while self._read_one(start_quote):
-            start_quote_counter += 1
+        quote_run_end: int = cast(re.Match[str], self._QUOTE_RUN_REGEXES[start_quote].match(self.string, self.string_index)).end()
+        start_quote_counter: int = 1 + quote_run_end - self.string_index
+        self.string_index = quote_run_end
 
         # Empty string
         if start_quote_counter == 2:
             return JsonhResult.from_value(JsonhToken(JsonTokenType.STRING, ""))
 
-        # Count multiple end quotes
-        end_quote_counter: int = 0
-
-        # Read string
-        string_builder: str = ""
-
-        while True:
-            next2: str | None = self._read()
-            if next2 == None:
-                return JsonhResult.from_error("Expected end of string, got end of input")
-
-            # Partial end quote was actually part of string
-            if next2 != start_quote:
-                string_builder += start_quote * end_quote_counter
-                end_quote_counter = 0
-
-            # End quote
-            if next2 == start_quote:
-                end_quote_counter += 1
-                if end_quote_counter == start_quote_counter:
-                    break
-            # Escape sequence
-            elif next2 == '\\':
-                if is_verbatim:
-                    string_builder += next2
+        # Fast path for strings without escape sequences
+        end_sequence: str = start_quote * start_quote_counter
+        end_index: int = self.string.find(end_sequence, self.string_index)
+        if end_index >= 0 and (is_verbatim or self.string.find('\\', self.string_index, end_index) < 0):
+            string_builder: str = self.string[self.string_index:end_index]
+            self.string_index = end_index + start_quote_counter
+        # Read string in runs of literal characters between quotes and escapes
+        else:
+            string_builder = ""
+
+            string: str = self.string
+            stop_regex: re.Pattern[str] = self._STRING_STOP_REGEXES[start_quote]
+            index: int = self.string_index
+
+            while True:
+                stop_match: re.Match[str] | None = stop_regex.search(string, index)
+                if stop_match == None:
+                    self.string_index = self._string_length
+                    return JsonhResult.from_error("Expected end of string, got end of input")
+
+                # Literal characters
+                string_builder += string[index:stop_match.start()]
+                stop: str = stop_match.group()
+
+                # End quote
+                if stop[0] == start_quote:
+                    if len(stop) >= start_quote_counter:
+                        self.string_index = stop_match.start() + start_quote_counter
+                        break
+                    # Partial end quote was actually part of string
+                    string_builder += stop
+                    index = stop_match.end()
+                # Escape sequence
+                elif is_verbatim:
+                    string_builder += stop
+                    index = stop_match.end()
                 else:
+                    self.string_index = stop_match.end()
                     escape_sequence_result: JsonhResult[str, str] = self._read_escape_sequence()
                     if escape_sequence_result.is_error:
                         return JsonhResult.from_error(escape_sequence_result.error())
                     string_builder += escape_sequence_result.value()
-            # Literal character
-            else:
-                string_builder += next2
+                    index = self.string_index
 
         # Condition: skip remaining steps unless started with multiple quotes
         if start_quote_counter > 1:
             # Pass 1: count leading whitespace -> newline
-            has_leading_whitespace_newline: bool = False
-            leading_whitespace_newline_counter: int = 0
-            index: int = 0
-            while index < len(string_builder):
-                next3: str = string_builder[index]
-
-                # Newline
-                if next3 in self._NEWLINE_CHARS:
-                    # Join CR LF
-                    if next3 == '\r' and index + 1 < len(string_builder) and string_builder[index + 1] == '\n':
-                        index += 1
-                    
-                    has_leading_whitespace_newline = True
-                    leading_whitespace_newline_counter = index + 1
-                    break
-                # Non-whitespace
-                elif next3 not in self._WHITESPACE_CHARS:
-                    break
-
-                index += 1
+            leading_match: re.Match[str] | None = self._LEADING_WHITESPACE_NEWLINE_REGEX.match(string_builder)
 
             # Condition: skip remaining steps if pass 1 failed
-            if has_leading_whitespace_newline:
+            if leading_match != None:
+                leading_whitespace_newline_counter: int = leading_match.end()
+
                 # Pass 2: count trailing newline -> whitespace
-                has_trailing_newline_whitespace: bool = False
-                last_newline_index: int = 0
-                trailing_whitespace_counter: int = 0
-                index: int = 0
-                while index < len(string_builder):
-                    next4: str = string_builder[index]
-
-                    # Newline
-                    if next4 in self._NEWLINE_CHARS:
-                        has_trailing_newline_whitespace = True
-                        last_newline_index = index
-                        trailing_whitespace_counter = 0
-
-                        # Join CR LF
-                        if next4 == '\r' and index + 1 < len(string_builder) and string_builder[index + 1] == '\n':
-                            index += 1
-                    # Whitespace
-                    elif next4 in self._WHITESPACE_CHARS:
-                        trailing_whitespace_counter += 1
-                    # Non-whitespace
-                    else:
-                        has_trailing_newline_whitespace = False
-                        trailing_whitespace_counter = 0
-
-                    index += 1
+                trailing_match: re.Match[str] | None = self._TRAILING_NEWLINE_WHITESPACE_REGEX.search(string_builder)
 
                 # Condition: skip remaining steps if pass 2 failed
-                if has_trailing_newline_whitespace:
+                if trailing_match != None:
+                    last_newline_index: int = trailing_match.start()
+                    trailing_whitespace_counter: int = len(trailing_match.group(1))
+
                     # Pass 3: strip trailing newline -> whitespace
                     string_builder = string_builder[:last_newline_index]
 
@@ -1185,39 +1362,11 @@ class JsonhReader:
                     # Condition: skip remaining steps if no trailing whitespace
                     if trailing_whitespace_counter > 0:
                         # Pass 5: strip line-leading whitespace
-                        is_line_leading_whitespace: bool = True
-                        line_leading_whitespace_counter: int = 0
-                        index: int = 0
-                        while index < len(string_builder):
-                            next5: str = string_builder[index]
-
-                            # Newline
-                            if next5 in self._NEWLINE_CHARS:
-                                is_line_leading_whitespace = True
-                                line_leading_whitespace_counter = 0
-                            # Whitespace
-                            elif next5 in self._WHITESPACE_CHARS:
-                                if is_line_leading_whitespace:
-                                    # Increment line-leading whitespace
-                                    line_leading_whitespace_counter += 1
-
-                                    # Maximum line-leading whitespace reached
-                                    if line_leading_whitespace_counter == trailing_whitespace_counter:
-                                        # Remove line-leading whitespace
-                                        string_builder = string_builder[:(index + 1 - line_leading_whitespace_counter)] + string_builder[(index + 1):]
-                                        index -= line_leading_whitespace_counter
-                                        # Exit line-leading whitespace
-                                        is_line_leading_whitespace = False
-                            # Non-whitespace
-                            else:
-                                if is_line_leading_whitespace:
-                                    # Remove partial line-leading whitespace
-                                    string_builder = string_builder[:(index - line_leading_whitespace_counter)] + string_builder[index:]
-                                    index -= line_leading_whitespace_counter
-                                    # Exit line-leading whitespace
-                                    is_line_leading_whitespace = False
-
-                            index += 1
+                        line_leading_whitespace_pattern: str = self._LINE_LEADING_WHITESPACE_PATTERN.format(
+                            count=trailing_whitespace_counter,
+                            partial_count=trailing_whitespace_counter - 1,
+                        )
+                        string_builder = re.sub(line_leading_whitespace_pattern, "", string_builder)
 
         # End of string
         return JsonhResult.from_value(JsonhToken(JsonTokenType.STRING, string_builder))
@@ -1228,40 +1377,45 @@ class JsonhReader:
         # Read quoteless string
         string_builder: str = initial_chars
 
-        while True:
-            # Peek char
-            next: str | None = self._peek()
-            if next == None:
+        string: str = self.string
+        string_length: int = self._string_length
+        stop_regex: re.Pattern[str] = self._quoteless_stop_regex
+        index: int = self.string_index
+
+        while index < string_length:
+            # Literal characters up to reserved character, newline or escape sequence
+            stop_match: re.Match[str] | None = stop_regex.search(string, index)
+            stop_index: int = stop_match.start() if stop_match != None else string_length
+            string_builder += string[index:stop_index]
+            index = stop_index
+            if index >= string_length:
                 break
 
             # Escape sequence
-            if next == '\\':
-                self._read()
+            if string[index] == '\\':
+                index += 1
                 if is_verbatim:
-                    string_builder += next
+                    string_builder += '\\'
                 else:
+                    self.string_index = index
                     escape_sequence_result: JsonhResult[str, str] = self._read_escape_sequence()
                     if escape_sequence_result.is_error:
                         return JsonhResult.from_error(escape_sequence_result.error())
                     string_builder += escape_sequence_result.value()
+                    index = self.string_index
                 is_named_literal_possible = False
-            # End on reserved character
-            elif next in self._RESERVED_CHARS():
-                break
-            # End on newline
-            elif next in self._NEWLINE_CHARS:
-                break
-            # Literal character
+            # End on reserved character or newline
             else:
-                self._read()
-                string_builder += next
+                break
+
+        self.string_index = index
 
         # Ensure not empty
         if len(string_builder) == 0:
             return JsonhResult.from_error("Empty quoteless string")
 
         # Trim whitespace
-        string_builder = self._strip_any(string_builder, self._WHITESPACE_CHARS)
+        string_builder = string_builder.strip(self._WHITESPACE_STRING)
 
         # Match named literal
         if is_named_literal_possible:
@@ -1277,124 +1431,86 @@ class JsonhReader:
         return JsonhResult.from_value(JsonhToken(JsonTokenType.STRING, string_builder))
 
     def _detect_quoteless_string(self) -> tuple[bool, str]:
-        # Read whitespace
-        whitespace_builder: str = ""
-
-        while True:
-            # Read char
-            next: str | None = self._peek()
-            if next == None:
-                break
-
-            # Newline
-            if next in self._NEWLINE_CHARS:
-                # Quoteless strings cannot contain unescaped newlines
-                found_quoteless_string: bool = False
-                whitespace_chars: str = whitespace_builder
-                return found_quoteless_string, whitespace_chars
-
-            # End of whitespace
-            if next not in self._WHITESPACE_CHARS:
-                break
-
-            # Whitespace
-            whitespace_builder += next
-            self._read()
+        # Read whitespace (up to any newline)
+        start_index: int = self.string_index
+        self.string_index = cast(re.Match[str], self._INLINE_WHITESPACE_REGEX.match(self.string, start_index)).end()
+        whitespace_chars: str = self.string[start_index:self.string_index]
 
         # Found quoteless string if found backslash or non-reserved char
+        # (quoteless strings cannot contain unescaped newlines)
         next_char: str | None = self._peek()
-        found_quoteless_string: bool = next_char != None and (next_char == '\\' or next_char not in self._RESERVED_CHARS())
-        whitespace_chars: str = whitespace_builder
+        found_quoteless_string: bool = next_char != None and next_char not in self._NEWLINE_CHARS and (next_char == '\\' or next_char not in self._reserved_chars)
         return found_quoteless_string, whitespace_chars
 
     def _read_number(self) -> tuple[JsonhResult[JsonhToken, str], str]:
-        # Read number
-        number_builder: JsonhRef[str] = JsonhRef[str]("")
+        # Read number (sliced from the string once read)
+        start_index: int = self.string_index
 
         # Read sign
-        sign: str | None = self._read_any('-', '+')
-        if sign != None:
-            number_builder.ref += sign
+        self._read_any('-', '+')
 
         # Read base
         base_digits: str = "0123456789"
         has_base_specifier: bool = False
         has_leading_zero: bool = False
         if self._read_one('0'):
-            number_builder.ref += '0'
             has_leading_zero = True
 
-            hex_base_char: str | None = self._read_any('x', 'X')
-            if hex_base_char != None:
-                number_builder.ref += hex_base_char
+            if self._read_any('x', 'X') != None:
                 base_digits = "0123456789abcdef"
                 has_base_specifier = True
                 has_leading_zero = False
-            else:
-                binary_base_char: str | None = self._read_any('b', 'B')
-                if binary_base_char != None:
-                    number_builder.ref += binary_base_char
-                    base_digits = "01"
-                    has_base_specifier = True
-                    has_leading_zero = False
-                else:
-                    octal_base_char: str | None = self._read_any('o', 'O')
-                    if octal_base_char != None:
-                        number_builder.ref += octal_base_char
-                        base_digits = "01234567"
-                        has_base_specifier = True
-                        has_leading_zero = False
+            elif self._read_any('b', 'B') != None:
+                base_digits = "01"
+                has_base_specifier = True
+                has_leading_zero = False
+            elif self._read_any('o', 'O') != None:
+                base_digits = "01234567"
+                has_base_specifier = True
+                has_leading_zero = False
 
         # Read main number
-        main_result: JsonhResult[None, str] = self._read_number_no_exponent(number_builder, base_digits, has_base_specifier, has_leading_zero)
+        main_result: JsonhResult[None, str] = self._read_number_no_exponent(start_index, base_digits, has_base_specifier, has_leading_zero)
         if main_result.is_error:
             number: JsonhResult[JsonhToken, str] = JsonhResult.from_error(main_result.error())
-            partial_chars_read: str = number_builder.ref
+            partial_chars_read: str = self.string[start_index:self.string_index]
             return number, partial_chars_read
 
         # Possible hexadecimal exponent
-        if number_builder.ref[-1] in ['e', 'E']:
+        if self.string[self.string_index - 1] in ['e', 'E']:
             # Read sign (mandatory)
-            exponent_sign: str | None = self._read_any('-', '+')
-            if exponent_sign != None:
-                number_builder.ref += exponent_sign
-
+            if self._read_any('-', '+') != None:
                 # Missing digit between base specifier and exponent (e.g. `0xe+`)
-                if has_base_specifier and len(number_builder.ref) == 4:
+                if has_base_specifier and self.string_index - start_index == 4:
                     number2: JsonhResult[JsonhToken, str] = JsonhResult.from_error("Missing digit between base specifier and exponent")
-                    partial_chars_read: str = number_builder.ref
+                    partial_chars_read: str = self.string[start_index:self.string_index]
                     return number2, partial_chars_read
 
                 # Read exponent number
-                exponent_result: JsonhResult[None, str] = self._read_number_no_exponent(number_builder, base_digits)
+                exponent_result: JsonhResult[None, str] = self._read_number_no_exponent(start_index, base_digits)
                 if exponent_result.is_error:
                     number3: JsonhResult[JsonhToken, str] = JsonhResult.from_error(exponent_result.error())
-                    partial_chars_read: str = number_builder.ref
+                    partial_chars_read: str = self.string[start_index:self.string_index]
                     return number3, partial_chars_read
         # Exponent
         else:
-            exponent_char: str | None = self._read_any('e', 'E')
-            if exponent_char != None:
-                number_builder.ref += exponent_char
-
+            if self._read_any('e', 'E') != None:
                 # Read sign
-                exponent_sign: str | None = self._read_any('-', '+')
-                if exponent_sign != None:
-                    number_builder.ref += exponent_sign
+                self._read_any('-', '+')
 
                 # Read exponent number
-                exponent_result2: JsonhResult[None, str] = self._read_number_no_exponent(number_builder, base_digits)
+                exponent_result2: JsonhResult[None, str] = self._read_number_no_exponent(start_index, base_digits)
                 if exponent_result2.is_error:
                     number4: JsonhResult[JsonhToken, str] = JsonhResult.from_error(exponent_result2.error())
-                    partial_chars_read: str = number_builder.ref
+                    partial_chars_read: str = self.string[start_index:self.string_index]
                     return number4, partial_chars_read
 
         # End of number
-        number5: JsonhResult[JsonhToken, str] = JsonhResult.from_value(JsonhToken(JsonTokenType.NUMBER, number_builder.ref))
+        number5: JsonhResult[JsonhToken, str] = JsonhResult.from_value(JsonhToken(JsonTokenType.NUMBER, self.string[start_index:self.string_index]))
         partial_chars_read: str = ""
         return number5, partial_chars_read
 
-    def _read_number_no_exponent(self, number_builder: JsonhRef[str], base_digits: str, has_base_specifier: bool = False, has_leading_zero: bool = False) -> JsonhResult[None, str]:
+    def _read_number_no_exponent(self, start_index: int, base_digits: str, has_base_specifier: bool = False, has_leading_zero: bool = False) -> JsonhResult[None, str]:
         # Leading underscore
         if (not has_base_specifier) and (not has_leading_zero) and self._peek() == '_':
             return JsonhResult.from_error("Leading `_` in number")
@@ -1406,54 +1522,58 @@ class JsonhReader:
         if has_leading_zero:
             is_empty = False
 
-        while True:
+        string: str = self.string
+        string_length: int = self._string_length
+        index: int = self.string_index
+
+        while index < string_length:
             # Peek char
-            next: str | None = self._peek()
-            if next == None:
-                break
+            next: str = string[index]
 
             # Digit
             if next.lower() in base_digits:
-                self._read()
-                number_builder.ref += next
+                index += 1
                 is_empty = False
             # Dot
             elif next == '.':
                 # Disallow dot following underscore
-                if len(number_builder.ref) >= 1 and number_builder.ref[-1] == '_':
+                if index > start_index and string[index - 1] == '_':
+                    self.string_index = index
                     return JsonhResult.from_error("`.` must not follow `_` in number")
 
-                self._read()
-                number_builder.ref += next
+                index += 1
                 is_empty = False
 
                 # Duplicate dot
                 if is_fraction:
+                    self.string_index = index
                     return JsonhResult.from_error("Duplicate `.` in number")
                 is_fraction = True
             # Underscore
             elif next == '_':
                 # Disallow underscore following dot
-                if len(number_builder.ref) >= 1 and number_builder.ref[-1] == '.':
+                if index > start_index and string[index - 1] == '.':
+                    self.string_index = index
                     return JsonhResult.from_error("`_` must not follow `.` in number")
 
-                self._read()
-                number_builder.ref += next
+                index += 1
                 is_empty = False
             # Other
             else:
                 break
 
+        self.string_index = index
+
         # Ensure not empty
         if is_empty:
             return JsonhResult.from_error("Empty number")
 
         # Ensure at least one digit
-        if not self._contains_any_except(number_builder.ref, ['.', '-', '+', '_']):
+        if not self._contains_any_except(self.string[start_index:self.string_index], ['.', '-', '+', '_']):
             return JsonhResult.from_error("Number must have at least one digit")
 
         # Trailing underscore
-        if number_builder.ref.endswith('_'):
+        if self.string[self.string_index - 1] == '_':
             return JsonhResult.from_error("Trailing `_` in number")
 
         # End of number
@@ -1476,43 +1596,46 @@ class JsonhReader:
         else:
             return self._read_quoteless_string(partial_chars_read)
 
-    def _read_primitive_element(self) -> JsonhResult[JsonhToken, str]:
-        # Peek char
-        next: str | None = self._peek()
-        if next == None:
-            return JsonhResult.from_error("Expected primitive element, got end of input")
-
+    def _read_primitive_element(self, element_kind: str | None) -> JsonhResult[JsonhToken, str]:
         # Number
-        if len(next) == 1 and ((ord('0') <= ord(next) <= ord('9')) or (next in ['-', '+', '.'])):
+        if element_kind == "number":
             return self._read_number_or_quoteless_string()
         # String
-        elif (next in ['"', '\'']) or (self.options.supports_version(JsonhVersion.V2) and next == '@'):
+        elif element_kind == "string" or (element_kind == "verbatim_string" and self._supports_v2):
             return self._read_string()
         # Quoteless string (or named literal)
         else:
             return self._read_quoteless_string()
 
-    def _read_comments_and_whitespace(self) -> Iterator[JsonhResult[JsonhToken, str]]:
+    def _read_comments_and_whitespace(self) -> Generator[JsonhResult[JsonhToken, str], None, bool | None]:
+        string: str = self.string
+        string_length: int = self._string_length
+        whitespace_regex: re.Pattern[str] = self._WHITESPACE_REGEX
+
         while True:
             # Whitespace
-            self._read_whitespace()
-
-            # Peek char
-            next: str | None = self._peek()
-            if next == None:
-                return
+            index: int = cast(re.Match[str], whitespace_regex.match(string, self.string_index)).end()
+            self.string_index = index
 
             # Comment
-            if next in ['#', '/']:
+            if index < string_length and string[index] in self._COMMENT_START_CHARS:
                 comment: JsonhResult[JsonhToken, str] = self._read_comment()
                 if comment.is_error:
                     yield comment
-                    return
+                    return True
                 yield comment
             # End of comments
             else:
                 return
 
+    def _read_whitespace_before_comment(self) -> bool:
+        """
+        Reads whitespace and returns whether a comment follows, so `_read_comments_and_whitespace()` is only started when needed.
+        """
+        index: int = cast(re.Match[str], self._WHITESPACE_REGEX.match(self.string, self.string_index)).end()
+        self.string_index = index
+        return index < self._string_length and self.string[index] in self._COMMENT_START_CHARS
+
     def _read_comment(self) -> JsonhResult[JsonhToken, str]:
         block_comment: bool = False
         start_nest_counter: int = 0
@@ -1528,10 +1651,11 @@ class JsonhReader:
             elif self._read_one('*'):
                 block_comment = True
             # Nestable block-style comment
-            elif self.options.supports_version(JsonhVersion.V2) and self._peek() == '=':
+            elif self._supports_v2 and self._peek() == '=':
                 block_comment = True
-                while self._read_one('='):
-                    start_nest_counter += 1
+                nest_end: int = cast(re.Match[str], self._NEST_COUNTER_REGEX.match(self.string, self.string_index)).end()
+                start_nest_counter = nest_end - self.string_index
+                self.string_index = nest_end
                 if not self._read_one('*'):
                     return JsonhResult.from_error("Expected `*` after start of nesting block comment")
             else:
@@ -1539,84 +1663,50 @@ class JsonhReader:
         else:
             return JsonhResult.from_error("Unexpected character")
 
-        # Read comment
-        comment_builder: str = ""
-
-        while True:
-            # Read char
-            next: str | None = self._read()
-
-            if block_comment:
-                # Error
-                if next == None:
-                    return JsonhResult.from_error("Expected end of block comment, got end of input")
-                
-                # End of block comment
-                if next == '*':
-                    # End of nestable block comment
-                    if self.options.supports_version(JsonhVersion.V2):
-                        # Count nests
-                        end_nest_counter: int = 0
-                        while end_nest_counter < start_nest_counter and self._read_one('='):
-                            end_nest_counter += 1
-                        # Partial end nestable block comment was actually part of comment
-                        if end_nest_counter < start_nest_counter or self._peek() != '/':
-                            comment_builder += '*'
-                            while end_nest_counter > 0:
-                                comment_builder += '='
-                                end_nest_counter -= 1
-                            continue
-
-                    # End of block comment
-                    if self._read_one('/'):
-                        return JsonhResult.from_value(JsonhToken(JsonTokenType.COMMENT, comment_builder))
-            else:
-                # End of line comment
-                if next == None or next in self._NEWLINE_CHARS:
-                    return JsonhResult.from_value(JsonhToken(JsonTokenType.COMMENT, comment_builder))
+        # Block comment
+        if block_comment:
+            # Find end of block comment
+            end_sequence: str = '*' + ('=' * start_nest_counter) + '/'
+            end_index: int = self.string.find(end_sequence, self.string_index)
+            if end_index < 0:
+                self.string_index = self._string_length
+                return JsonhResult.from_error("Expected end of block comment, got end of input")
+
+            # End of block comment
+            comment: str = self.string[self.string_index:end_index]
+            self.string_index = end_index + len(end_sequence)
+            return JsonhResult.from_value(JsonhToken(JsonTokenType.COMMENT, comment))
+        # Line comment
+        else:
+            # Find end of line comment
+            line_match: re.Match[str] = cast(re.Match[str], self._LINE_COMMENT_REGEX.match(self.string, self.string_index))
+            end_index2: int = line_match.end()
 
-            # Comment char
-            comment_builder += next
+            # End of line comment (including newline)
+            comment2: str = line_match.group()
+            if end_index2 < self._string_length:
+                end_index2 += 1
+            self.string_index = end_index2
+            return JsonhResult.from_value(JsonhToken(JsonTokenType.COMMENT, comment2))
 
     def _read_whitespace(self) -> None:
-        while True:
-            # Peek char
-            next: str | None = self._peek()
-            if next == None:
-                return
-            
-            # Whitespace
-            if next in self._WHITESPACE_CHARS:
-                self._read()
-            # End of whitespace
-            else:
-                return
+        # Whitespace
+        whitespace_match: re.Match[str] = cast(re.Match[str], self._WHITESPACE_REGEX.match(self.string, self.string_index))
+        self.string_index = whitespace_match.end()
 
     def _read_hex_sequence(self, length: int) -> JsonhResult[int, str]:
         assert(length <= 8)
 
-        value: int = 0
-
-        for _ in range(0, length):
-            next: str | None = self._read()
-
-            # Hex digit
-            if next != None and ((ord('0') <= ord(next) <= ord('9')) or (ord('A') <= ord(next) <= ord('F')) or (ord('a') <= ord(next) <= ord('f'))):
-                # Get hex digit
-                digit: int = ord(next)
-                # Convert hex digit to integer
-                integer: int = \
-                    digit - ord('A') + 10 if (digit >= ord('A') and digit <= ord('F')) else \
-                    digit - ord('a') + 10 if (digit >= ord('a') and digit <= ord('f')) else \
-                    digit - ord('0')
-                # Aggregate digit into value
-                value = (value * 16) + integer
-            # Unexpected char
-            else:
-                return JsonhResult.from_error("Incorrect number of hexadecimal digits in unicode escape sequence")
+        # Read hex digits
+        hex_digits: str = cast(re.Match[str], self._HEX_DIGITS_REGEX.match(self.string, self.string_index, self.string_index + length)).group()
+        if len(hex_digits) != length:
+            # Consume the unexpected char
+            self.string_index = min(self.string_index + len(hex_digits) + 1, self._string_length)
+            return JsonhResult.from_error("Incorrect number of hexadecimal digits in unicode escape sequence")
+        self.string_index += length
 
-        # Return aggregated value
-        return JsonhResult.from_value(value)
+        # Convert hex digits to integer
+        return JsonhResult.from_value(int(hex_digits, 16))
 
     def _read_escape_sequence(self, high_surrogate: int | None = None) -> JsonhResult[str, str]:
         escape_char: str | None = self._read()
@@ -1624,58 +1714,28 @@ class JsonhReader:
             return JsonhResult.from_error("Expected escape sequence, got end of input")
 
         # Ensure high surrogates are completed
-        if high_surrogate != None and escape_char not in ['u', 'x', 'U']:
+        if high_surrogate != None and escape_char not in self._HEX_ESCAPE_SEQUENCE_LENGTHS:
             return JsonhResult.from_error("Expected low surrogate after high surrogate")
 
-        match escape_char:
-            # Reverse solidus
-            case '\\':
-                return JsonhResult.from_value('\\')
-            # Backspace
-            case 'b':
-                return JsonhResult.from_value('\b')
-            # Form feed
-            case 'f':
-                return JsonhResult.from_value('\f')
-            # Newline
-            case 'n':
-                return JsonhResult.from_value('\n')
-            # Carriage return
-            case 'r':
-                return JsonhResult.from_value('\r')
-            # Tab
-            case 't':
-                return JsonhResult.from_value('\t')
-            # Vertical tab
-            case 'v':
-                return JsonhResult.from_value('\v')
-            # Null
-            case '0':
-                return JsonhResult.from_value('\0')
-            # Alert
-            case 'a':
-                return JsonhResult.from_value('\a')
-            # Escape
-            case 'e':
-                return JsonhResult.from_value('\u001b')
-            # Unicode hex sequence
-            case 'u':
-                return self._read_hex_escape_sequence(4, high_surrogate)
-            # Short unicode hex sequence
-            case 'x':
-                return self._read_hex_escape_sequence(2, high_surrogate)
-            # Long unicode hex sequence
-            case 'U':
-                return self._read_hex_escape_sequence(8, high_surrogate)
-            # Escaped newline
-            case _ if escape_char in self._NEWLINE_CHARS:
-                # Join CR LF
-                if escape_char == 'r':
-                    self._read_one('\n')
-                return JsonhResult.from_value("")
-            # Other
-            case _:
-                return JsonhResult.from_value(escape_char)
+        # Single-character escape
+        escaped: str | None = self._ESCAPE_SEQUENCES.get(escape_char)
+        if escaped != None:
+            return JsonhResult.from_value(escaped)
+
+        # Unicode hex sequence
+        hex_length: int | None = self._HEX_ESCAPE_SEQUENCE_LENGTHS.get(escape_char)
+        if hex_length != None:
+            return self._read_hex_escape_sequence(hex_length, high_surrogate)
+
+        # Escaped newline
+        if escape_char in self._NEWLINE_CHARS:
+            # Join CR LF
+            if escape_char == 'r':
+                self._read_one('\n')
+            return JsonhResult.from_value("")
+
+        # Other
+        return JsonhResult.from_value(escape_char)
 
     def _read_hex_escape_sequence(self, length: int, high_surrogate: int | None) -> JsonhResult[str, str]:
         code_point: JsonhResult[int, str] = self._read_hex_sequence(length)
@@ -1715,17 +1775,18 @@ class JsonhReader:
         return code_point >= 0xDC00 and code_point <= 0xDFFF
 
     def _peek(self) -> str | None:
-        if self.string_index >= len(self.string):
+        string_index: int = self.string_index
+        if string_index >= self._string_length:
             return None
-        next: str = self.string[self.string_index]
+        next: str = self.string[string_index]
         return next
 
     def _read(self) -> str | None:
-        if self.string_index >= len(self.string):
+        string_index: int = self.string_index
+        if string_index >= self._string_length:
             return None
-        next: str = self.string[self.string_index]
-        self.string_index += 1
-        self.char_counter += 1
+        next: str = self.string[string_index]
+        self.string_index = string_index + 1
         return next
 
     def _read_one(self, option: str) -> bool:
@@ -1746,19 +1807,6 @@ class JsonhReader:
         self._read()
         return next
 
-    @staticmethod
-    def _strip_any(input: str, trim_chars: Iterable[str]) -> str:
-        start: int = 0
-        end: int = len(input)
-
-        while start < end and input[start] in trim_chars:
-            start += 1
-
-        while end > start and input[end - 1] in trim_chars:
-            end -= 1
-
-        return input[start:end]
-
     @staticmethod
     def _contains_any_except(input: str, allowed: Iterable[str]) -> bool:
         for char in input: